@@ -124,6 +124,7 @@ class AVLTreeList(object):
 	def __init__(self):
 		self.size = 0
 		self.root = None
+		self.journal = None  # List of positional operations since last checkpoint, None if journaling is off
 
 	"""Finds the rank of node using the rank algo taught
 	COMPLEXITY: O(logn)"""
@@ -246,6 +247,8 @@ class AVLTreeList(object):
 				predecessor.right.value = val
 				self.create_virtual_children(predecessor.right)
 				rebalancing_amount = self.fix_tree_insert(predecessor.right)
+		if self.journal is not None:  # Recorded only once the node was actually inserted
+			self.journal.append(("insert", i, val))
 		self.size += 1  # New node inserted, tree size += 1
 		return rebalancing_amount
 
@@ -352,6 +355,8 @@ class AVLTreeList(object):
 		delete = self.select(self.root, i + 1)  # Finds the node that should be deleted
 		if delete is None:
 			return -1
+		if self.journal is not None:
+			self.journal.append(("delete", i))
 		if delete == self.root and (delete.left.value is None or delete.right.value is None):
 			rebalancing_amount = 0
 			self.delete_root()
@@ -564,9 +569,32 @@ class AVLTreeList(object):
 	@param lst: a list to be concatenated after self
 	@rtype: int
 	@returns: the absolute value of the difference between the height of the AVL trees joined
-	COMPLEXITY: O(logn)
+	COMPLEXITY: O(logn), O(logn + lst.length()) if journaling is on
 	"""
 	def concat(self, lst):
+		journal = self.journal
+		lst_journal = lst.journal
+		values = None
+		if journal is not None and lst.size > 0:  # Empty lst changes nothing, no entry is needed
+			values = lst.listToArray()  # Taken before the join, since the join changes lst
+		# The join uses insert and delete internally, those shouldn't be recorded as separate operations
+		self.journal = None
+		lst.journal = None
+		height_diff = self.join(lst)
+		self.journal = journal
+		lst.journal = lst_journal
+		if values is not None:
+			journal.append(("concat", values))
+		return height_diff
+
+	"""joins lst to the end of self, internal helper of concat which doesn't record the journal
+	@type lst: AVLTreeList
+	@param lst: a list to be joined after self
+	@rtype: int
+	@returns: the absolute value of the difference between the height of the AVL trees joined
+	COMPLEXITY: O(logn)
+	"""
+	def join(self, lst):
 		if self.root is None and lst.root is None:  # Empty trees
 			return 0
 		if self.root is None:  # One empty tree
@@ -645,6 +673,118 @@ class AVLTreeList(object):
 		self.size = new_size
 		return abs(height_diff)
 
+	"""starts recording the positional operations (insert, delete, concat) performed on the list
+	@rtype: None
+	"""
+	def startJournal(self):
+		if self.journal is None:
+			self.journal = []
+
+	"""stops recording operations
+	@rtype: list
+	@returns: the entries recorded since the last checkpoint, as checkpoint returns them, None if journaling is off
+	"""
+	def stopJournal(self):
+		entries = self.journal
+		self.journal = None
+		return entries
+
+	"""returns the operations recorded since the last checkpoint, and starts a new empty journal
+	@rtype: list
+	@returns: a list of ("insert", i, val), ("delete", i) and ("concat", values) entries, in order,
+	None if journaling is off
+	COMPLEXITY: O(1)
+	"""
+	def checkpoint(self):
+		if self.journal is None:  # Not an empty delta, changes may have been made without being recorded
+			return None
+		entries = self.journal
+		self.journal = []
+		return entries
+
+	"""compacts the journal into a fresh base snapshot of the list
+	@rtype: list
+	@returns: a list of strings representing the data structure, entries recorded so far are dropped
+	COMPLEXITY: O(n)
+	"""
+	def compact(self):
+		if self.journal is not None:
+			self.journal = []
+		return self.listToArray()
+
+	"""applies the operations of a journal to the list, in order
+	@type journal: list
+	@param journal: entries as returned by checkpoint
+	@pre: the list holds the values it held when the first entry of journal was recorded
+	@rtype: int
+	@returns: the number of entries applied, replayed entries aren't recorded in the list's own journal
+	raises ValueError on an entry with an unknown tag, or an index that doesn't fit the list. Entries before it stay applied
+	COMPLEXITY: O(k*logn), runs of insertions to the end and concats are joined as one tree in O(r + logn)
+	"""
+	def replay(self, journal):
+		own_journal = self.journal
+		self.journal = None  # Replayed operations aren't recorded again
+		batch = []  # Values waiting to be appended to the end of the list
+		for entry in journal:
+			if entry[0] == "insert" and entry[1] == self.size + len(batch):  # Insert-Last, can be batched
+				batch.append(entry[2])
+			elif entry[0] == "concat":
+				batch.extend(entry[1])
+			else:
+				self.append_batch(batch)
+				batch = []
+				if entry[0] == "insert" and 0 <= entry[1] <= self.size:
+					self.insert(entry[1], entry[2])
+				elif entry[0] == "delete" and 0 <= entry[1] < self.size:
+					self.delete(entry[1])
+				else:  # Malformed entry, or the list has drifted from the journal's source
+					self.journal = own_journal
+					raise ValueError("journal entry %s can't be applied to a list of length %d" % (entry, self.size))
+		self.append_batch(batch)
+		self.journal = own_journal
+		return len(journal)
+
+	"""appends the values of lst to the end of the list, internal helper of replay
+	@type lst: list
+	@param lst: the values to be appended, in order
+	@rtype: None
+	COMPLEXITY: O(len(lst) + logn)
+	"""
+	def append_batch(self, lst):
+		if len(lst) == 0:
+			return
+		tree = AVLTreeList()
+		tree.root = self.build_tree_in_order(lst, 0, len(lst) - 1)
+		tree.size = len(lst)
+		self.concat(tree)
+
+	"""builds a balanced AVL tree from lst[start..end] recursively, keeping the order of lst, internal helper of append_batch
+	@type lst: list
+	@param lst: the values of the tree, in order
+	@type start: int
+	@param start: index of the first value in lst
+	@type end: int
+	@param end: index of the last value in lst
+	@rtype: AVLNode
+	@returns: the root of the tree, a virtual node if start > end
+	COMPLEXITY: O(end - start)
+	"""
+	def build_tree_in_order(self, lst, start, end):
+		if start > end:
+			virtual = AVLNode(None)
+			virtual.size = 0
+			return virtual
+		mid = (start + end) // 2
+		node = AVLNode(lst[mid])
+		node.left = self.build_tree_in_order(lst, start, mid - 1)
+		node.left.parent = node
+		node.right = self.build_tree_in_order(lst, mid + 1, end)
+		node.right.parent = node
+		node.size = node.left.size + node.right.size + 1
+		node.height = max(node.left.height, node.right.height) + 1
+		node.bf = node.left.height - node.right.height
+		return node
+
 	"""searches for a *value* in the list
 	@type val: str
 	@param val: a value to be searched